@@ -11,7 +11,6 @@ __all__ = [
 ]
 
 import logging
-import weakref
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 from typing import Dict, Type, Optional, Mapping, Any
@@ -35,7 +34,7 @@ log = logging.getLogger('mongoengine-migrate')
 
 class BaseActionMeta(ABCMeta):
     def __new__(mcs, name, bases, attrs):
-        attrs['_meta'] = weakref.proxy(mcs)
+        attrs['_meta'] = mcs
 
         c = super(BaseActionMeta, mcs).__new__(mcs, name, bases, attrs)
         if not name.startswith('Base'):
@@ -494,7 +493,7 @@ class BaseAlterDocument(BaseDocumentAction):
                 key=name
             )
 
-            log.debug(">> Change %s: %s => %s", repr(name), repr(diff.old), repr(diff.new))
+            log.debug(">> Change %r: %r => %r", name, diff.old, diff.new)
             try:
                 method = getattr(self, f'change_{name}')
             except AttributeError as e:
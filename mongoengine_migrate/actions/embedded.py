@@ -6,6 +6,7 @@ __all__ = [
 ]
 
 import logging
+import sys
 
 from mongoengine_migrate.flags import EMBEDDED_DOCUMENT_NAME_PREFIX
 from mongoengine_migrate.schema import Schema
@@ -15,24 +16,29 @@ from mongoengine_migrate.updater import DocumentUpdater, ByDocContext, ByPathCon
 
 log = logging.getLogger('mongoengine-migrate')
 
+#: Embedded document prefix is known at import time, so document type
+#: is checked by comparing its slice with the interned prefix string
+_EMBEDDED_PREFIX = sys.intern(EMBEDDED_DOCUMENT_NAME_PREFIX)
+_EMBEDDED_PREFIX_LEN = len(_EMBEDDED_PREFIX)
 
-class CreateEmbedded(BaseCreateDocument):
-    """
-    Create new embedded document
-    Should have the highest priority and be at top of every migration
-    since fields actions could refer to this document and its schema
-    representation.
-    """
-    priority = 4
 
+class _EmbeddedBuildObjectMixin:
+    """Restricts `build_object` of document action to embedded
+    documents only. Must be placed before base action class in bases
+    """
     @classmethod
     def build_object(cls, document_type: str, left_schema: Schema, right_schema: Schema):
-        if not document_type.startswith(EMBEDDED_DOCUMENT_NAME_PREFIX):
+        if document_type[:_EMBEDDED_PREFIX_LEN] != _EMBEDDED_PREFIX:
             # This is not an embedded document
             return None
 
-        return super(CreateEmbedded, cls).build_object(document_type, left_schema, right_schema)
+        return super().build_object(document_type, left_schema, right_schema)
+
 
+class _EmbeddedSchemaOnlyMixin(_EmbeddedBuildObjectMixin):
+    """Embedded document actions which change only schema and do not
+    touch the database. Must be placed before base action class in bases
+    """
     def run_forward(self):
         """Embedded documents are not required to do anything"""
 
@@ -40,7 +46,17 @@ class CreateEmbedded(BaseCreateDocument):
         """Embedded documents are not required to do anything"""
 
 
-class DropEmbedded(BaseDropDocument):
+class CreateEmbedded(_EmbeddedSchemaOnlyMixin, BaseCreateDocument):
+    """
+    Create new embedded document
+    Should have the highest priority and be at top of every migration
+    since fields actions could refer to this document and its schema
+    representation.
+    """
+    priority = 4
+
+
+class DropEmbedded(_EmbeddedSchemaOnlyMixin, BaseDropDocument):
     """
     Drop embedded document
     Should have the lowest priority and be at bottom of every migration
@@ -49,55 +65,19 @@ class DropEmbedded(BaseDropDocument):
     """
     priority = 18
 
-    @classmethod
-    def build_object(cls, document_type: str, left_schema: Schema, right_schema: Schema):
-        if not document_type.startswith(EMBEDDED_DOCUMENT_NAME_PREFIX):
-            # This is not an embedded document
-            return None
-
-        return super(DropEmbedded, cls).build_object(document_type, left_schema, right_schema)
 
-    def run_forward(self):
-        """Embedded documents are not required to do anything"""
-
-    def run_backward(self):
-        """Embedded documents are not required to do anything"""
-
-
-class RenameEmbedded(BaseRenameDocument):
+class RenameEmbedded(_EmbeddedSchemaOnlyMixin, BaseRenameDocument):
     """
     Rename embedded document
     Should be checked before CreateEmbedded in order to detect renaming
     """
     priority = 2
 
-    @classmethod
-    def build_object(cls, document_type: str, left_schema: Schema, right_schema: Schema):
-        if not document_type.startswith(EMBEDDED_DOCUMENT_NAME_PREFIX):
-            # This is not an embedded document
-            return None
-
-        return super(RenameEmbedded, cls).build_object(document_type, left_schema, right_schema)
-
-    def run_forward(self):
-        """Embedded documents are not required to do anything"""
-
-    def run_backward(self):
-        """Embedded documents are not required to do anything"""
-
 
-class AlterEmbedded(BaseAlterDocument):
+class AlterEmbedded(_EmbeddedBuildObjectMixin, BaseAlterDocument):
     """Alter whole embedded document changes"""
     priority = 5
 
-    @classmethod
-    def build_object(cls, document_type: str, left_schema: Schema, right_schema: Schema):
-        if not document_type.startswith(EMBEDDED_DOCUMENT_NAME_PREFIX):
-            # This is not an embedded document
-            return None
-
-        return super(AlterEmbedded, cls).build_object(document_type, left_schema, right_schema)
-
     def change_inherit(self, updater: DocumentUpdater, diff: Diff):
         """Remove '_cls' key if EmbeddedDocument becomes non-inherit,
         otherwise do nothing
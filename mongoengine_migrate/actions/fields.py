@@ -278,9 +278,7 @@ class AlterField(BaseFieldAction):
         # Change field type first, obtain new field handler object
         # and process other parameters with it
         if type_key != right_field_schema['type_key']:
-            log.debug(">> Change 'type_key': %s => %s",
-                      repr(type_key),
-                      repr(right_field_schema['type_key']))
+            log.debug(">> Change 'type_key': %r => %r", type_key, right_field_schema['type_key'])
             field_handler.change_param(db_field, 'type_key')
             field_handler = self._get_field_handler(right_field_schema['type_key'],
                                                     left_field_schema,
@@ -295,7 +293,7 @@ class AlterField(BaseFieldAction):
             if name == 'type_key' or new_value == old_value:
                 continue
 
-            log.debug(">> Change %s: %s => %s", repr(name), repr(old_value), repr(new_value))
+            log.debug(">> Change %r: %r => %r", name, old_value, new_value)
             field_handler.change_param(db_field, name)
 
             # If `db_field` was changed then work with new name further
@@ -4,7 +4,6 @@ __all__ = [
 ]
 
 import inspect
-import weakref
 from typing import Type, Iterable, List, Tuple, Collection, Any
 
 import mongoengine.fields
@@ -12,12 +11,16 @@ from pymongo.database import Database
 
 import mongoengine_migrate.flags as flags
 from mongoengine_migrate.exceptions import SchemaError, MigrationError, ActionError
-from mongoengine_migrate.fields.registry import type_key_registry, add_field_handler
+from mongoengine_migrate.fields.registry import (
+    type_key_registry,
+    add_field_handler,
+    get_parent_type_key,
+    get_type_converter
+)
 from mongoengine_migrate.graph import MigrationPolicy
-from mongoengine_migrate.mongo import check_empty_result
+from mongoengine_migrate.mongo import check_empty_result, bulk_update_many
 from mongoengine_migrate.schema import Schema
-from mongoengine_migrate.utils import get_closest_parent, document_type_to_class_name, Diff, UNSET
-from .registry import CONVERTION_MATRIX
+from mongoengine_migrate.utils import document_type_to_class_name, Diff, UNSET
 from ..updater import ByPathContext, ByDocContext, DocumentUpdater
 
 
@@ -26,15 +29,23 @@ class FieldHandlerMeta(type):
         me_classes_attr = 'field_classes'
         me_classes = attrs.get(me_classes_attr)
 
-        assert not {'field_name', 'document_type'} & attrs.get('schema_skel_keys', set()), \
+        assert {'field_name', 'document_type'}.isdisjoint(attrs.get('schema_skel_keys', ())), \
             "Handler schema_skel_keys shouldn't have keys matched with BaseAction parameters"
 
         assert isinstance(me_classes, (List, Tuple)) or me_classes is None, \
             f'{me_classes_attr} must be mongoengine field classes list'
 
-        attrs['_meta'] = weakref.proxy(mcs)
+        attrs['_meta'] = mcs
 
         klass = super(FieldHandlerMeta, mcs).__new__(mcs, name, bases, attrs)
+
+        # Schema skel keys of the class and all its parents. Parent
+        # keys go first
+        skel_keys = []
+        for base in reversed(inspect.getmro(klass)):
+            skel_keys.extend(getattr(base, 'schema_skel_keys', []))
+        klass._all_schema_skel_keys = tuple(dict.fromkeys(skel_keys))
+
         if me_classes:
             for me_class in me_classes:
                 add_field_handler(me_class, klass)
@@ -49,6 +60,11 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
 
     Also this is base class for other field-specific handlers
     """
+    __slots__ = (
+        'db', 'document_type', 'left_schema', 'left_field_schema', 'right_field_schema',
+        'migration_policy', 'is_embedded', 'collection'
+    )
+
     #: Mongoengine field classes which concrete handler can be used for
     field_classes: Iterable[Type[mongoengine.fields.BaseField]] = [
         mongoengine.fields.BaseField
@@ -97,11 +113,7 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         Return db schema skeleton dict, which contains keys taken from
         `schema_skel_keys` and Nones as values
         """
-        keys = []
-        for klass in reversed(inspect.getmro(cls)):
-            keys.extend(getattr(klass, 'schema_skel_keys', []))
-
-        return {f: None for f in keys}
+        return dict.fromkeys(cls._all_schema_skel_keys)
 
     @classmethod
     def build_schema(cls, field_obj: mongoengine.fields.BaseField) -> dict:
@@ -114,8 +126,9 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         :param field_obj: mongoengine field object
         :return: field schema dict
         """
-        schema_skel = cls.schema_skel()
-        schema = {f: getattr(field_obj, f, val) for f, val in schema_skel.items()}
+        schema = cls.schema_skel()
+        for f, val in schema.items():
+            schema[f] = getattr(field_obj, f, val)
 
         if 'default' in schema:
             schema['default'] = cls._normalize_default(schema['default'])
@@ -127,15 +140,12 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         if field_class.__name__ in type_key_registry:
             schema['type_key'] = field_class.__name__
         else:
-            registry_field_cls = get_closest_parent(
-                field_class,
-                (x.field_cls for x in type_key_registry.values())
-            )
-            if registry_field_cls is None:
+            type_key = get_parent_type_key(field_class)
+            if type_key is None:
                 raise ActionError(f'Could not find {field_class!r} or one of its base classes '
                                   f'in type_key registry')
 
-            schema['type_key'] = registry_field_cls.__name__
+            schema['type_key'] = type_key
 
         return schema
 
@@ -158,7 +168,10 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
             key=name
         )
 
-        method = getattr(self, f'change_{name}')
+        method = getattr(self, f'change_{name}', None)
+        if method is None:
+            raise SchemaError(f'Unknown field parameter: {name}')
+
         inherit = self.left_schema[self.document_type].parameters.get('inherit')
         document_cls = document_type_to_class_name(self.document_type) if inherit else None
         updater = DocumentUpdater(self.db, self.document_type, self.left_schema, db_field,
@@ -174,10 +187,11 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         """
         def by_path(ctx: ByPathContext):
             path = ctx.filter_dotpath.split('.')[:-1]
-            ctx.collection.update_many(
-                {ctx.filter_dotpath: {'$exists': True}, **ctx.extra_filter},
-                {'$rename': {ctx.filter_dotpath: '.'.join(path + [diff.new])}}
-            )
+            fltr = {ctx.filter_dotpath: {'$exists': True}, **ctx.extra_filter}
+            # Pipeline $set/$unset is not used here since on a path
+            # through an array it writes the whole array of values
+            update = {'$rename': {ctx.filter_dotpath: '.'.join(path + [diff.new])}}
+            bulk_update_many(ctx.collection, fltr, update)
 
         def by_doc(ctx: ByDocContext):
             doc = ctx.document
@@ -249,9 +263,10 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         :return:
         """
         def by_path(ctx: ByPathContext):
-            choices = diff.new
+            # Choices could be any collection, e.g. a set, which is
+            # not BSON-encodable, so pass a list to a query
             fltr = {
-                ctx.filter_dotpath: {'$nin': choices, '$exists': True},
+                ctx.filter_dotpath: {'$nin': list(diff.new), '$exists': True},
                 **ctx.extra_filter
             }
             check_empty_result(ctx.collection, ctx.filter_dotpath, fltr)
@@ -284,21 +299,22 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
             raise SchemaError(f"Old or new {updater.document_type}{updater.field_name}.type_key "
                               f"values are not set")
 
-        field_classes = []
+        registry_items = []
         for val in (diff.old, diff.new):
-            if val not in type_key_registry:
+            registry_item = type_key_registry.get(val)
+            if registry_item is None:
                 raise SchemaError(f'Unknown type_key {updater.document_type}{updater.field_name}: '
                                   f'{val!r}')
-            field_classes.append(type_key_registry[val].field_cls)
+            registry_items.append(registry_item)
 
-        new_handler_cls = type_key_registry[diff.new].field_handler_cls
-        new_handler = new_handler_cls(self.db,
-                                      self.document_type,
-                                      self.left_schema,
-                                      self.left_field_schema,
-                                      self.right_field_schema,
-                                      self.migration_policy)
-        new_handler.convert_type(updater, *field_classes)
+        old_registry_item, new_registry_item = registry_items
+        new_handler = new_registry_item.field_handler_cls(self.db,
+                                                          self.document_type,
+                                                          self.left_schema,
+                                                          self.left_field_schema,
+                                                          self.right_field_schema,
+                                                          self.migration_policy)
+        new_handler.convert_type(updater, old_registry_item.field_cls, new_registry_item.field_cls)
 
     def convert_type(self,
                      updater: DocumentUpdater,
@@ -324,17 +340,7 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
          further
         :return:
         """
-
-        type_converters = CONVERTION_MATRIX.get(from_field_cls) or \
-            CONVERTION_MATRIX.get(get_closest_parent(from_field_cls, CONVERTION_MATRIX.keys()))
-
-        if type_converters is None:
-            raise MigrationError(f'Type converter not found for convertion '
-                                 f'{from_field_cls!r} -> {to_field_cls!r}')
-
-        type_converter = type_converters.get(to_field_cls) or \
-            type_converters.get(get_closest_parent(to_field_cls, type_converters))
-
+        type_converter = get_type_converter(from_field_cls, to_field_cls)
         if type_converter is None:
             raise MigrationError(f'Type converter not found for convertion '
                                  f'{from_field_cls!r} -> {to_field_cls!r}')
@@ -391,7 +397,8 @@ class CommonFieldHandler(metaclass=FieldHandlerMeta):
         """Set a given value only for unset fields"""
         def by_path(ctx: ByPathContext):
             # Update documents only
-            ctx.collection.update_many(
+            bulk_update_many(
+                ctx.collection,
                 {ctx.filter_dotpath: {'$exists': False}, **ctx.extra_filter},
                 {'$set': {ctx.update_dotpath: value}},
                 array_filters=ctx.build_array_filters()
@@ -36,6 +36,8 @@ from .converters import to_string, to_decimal
 
 
 class NumberFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.IntField,
         mongoengine.fields.LongField,
@@ -81,6 +83,8 @@ class NumberFieldHandler(CommonFieldHandler):
 
 
 class StringFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.StringField,
     ]
@@ -153,6 +157,8 @@ class StringFieldHandler(CommonFieldHandler):
 
 
 class URLFieldHandler(StringFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.URLField,
     ]
@@ -176,6 +182,8 @@ class URLFieldHandler(StringFieldHandler):
 
 
 class EmailFieldHandler(StringFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.EmailField
     ]
@@ -283,6 +291,8 @@ class EmailFieldHandler(StringFieldHandler):
 
 
 class DecimalFieldHandler(NumberFieldHandler):
+    __slots__ = ()
+
     field_classes = [mongoengine.fields.DecimalField]
 
     schema_skel_keys = {'force_string', 'precision', 'rounding'}
@@ -319,6 +329,8 @@ class DecimalFieldHandler(NumberFieldHandler):
 
 
 class ComplexDateTimeFieldHandler(StringFieldHandler):
+    __slots__ = ()
+
     field_classes = [mongoengine.fields.ComplexDateTimeField]
 
     schema_skel_keys = {'separator'}
@@ -341,12 +353,21 @@ class ComplexDateTimeFieldHandler(StringFieldHandler):
 
 
 class ListFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.ListField
     ]
 
     schema_skel_keys = set()  # TODO: implement "field"
 
+    #: Optional keys which are added to skel if they are set in field
+    #: object. Checked once since they depend on mongoengine version
+    #: * `max_length` was added in mongoengine 0.19.0
+    _optional_skel_keys = tuple(
+        k for k in ('max_length', ) if hasattr(mongoengine.fields.ListField(), k)
+    )
+
     @classmethod
     def schema_skel(cls) -> dict:
         """
@@ -355,13 +376,9 @@ class ListFieldHandler(CommonFieldHandler):
         """
         skel = super(ListFieldHandler, cls).schema_skel()
 
-        # Add optional keys to skel if they are set in field object
-        # * `max_length` was added in mongoengine 0.19.0
-        optional_keys = {'max_length'}
         assert all(issubclass(c, mongoengine.fields.ListField) for c in cls.field_classes), \
             'If you wanna add field class then this code should be rewritten'
-        field_obj = mongoengine.fields.ListField()
-        skel.update({k: None for k in optional_keys if hasattr(field_obj, k)})
+        skel.update(dict.fromkeys(cls._optional_skel_keys))
 
         return skel
 
@@ -381,10 +398,12 @@ class ListFieldHandler(CommonFieldHandler):
 
 
 class DictFieldHandler(CommonFieldHandler):
-    pass  # TODO: implement "field" param
+    __slots__ = ()  # TODO: implement "field" param
 
 
 class BinaryFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.BinaryField
     ]
@@ -405,6 +424,8 @@ class BinaryFieldHandler(CommonFieldHandler):
 
 
 class SequenceFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.SequenceField
     ]
@@ -429,6 +450,8 @@ class SequenceFieldHandler(CommonFieldHandler):
 
 
 class UUIDFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.UUIDField
     ]
@@ -447,6 +470,8 @@ class UUIDFieldHandler(CommonFieldHandler):
 
 
 class ReferenceFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.ReferenceField,
         mongoengine.fields.LazyReferenceField
@@ -501,6 +526,8 @@ class ReferenceFieldHandler(CommonFieldHandler):
 
 
 class CachedReferenceFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.CachedReferenceField
     ]
@@ -546,6 +573,8 @@ class CachedReferenceFieldHandler(CommonFieldHandler):
 
 
 class FileFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.FileField
     ]
@@ -562,6 +591,8 @@ class FileFieldHandler(CommonFieldHandler):
 
 
 class ImageFieldHandler(FileFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.ImageField
     ]
@@ -584,6 +615,8 @@ class ImageFieldHandler(FileFieldHandler):
 
 
 class EmbeddedDocumentFieldHandler(CommonFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.EmbeddedDocumentField
     ]
@@ -605,6 +638,8 @@ class EmbeddedDocumentFieldHandler(CommonFieldHandler):
 
 
 class EmbeddedDocumentListFieldHandler(ListFieldHandler):
+    __slots__ = ()
+
     field_classes = [
         mongoengine.fields.EmbeddedDocumentListField
     ]
@@ -3,18 +3,21 @@ __all__ = [
     'type_key_registry',
     'add_type_key',
     'add_field_handler',
+    'get_parent_type_key',
+    'get_type_converter',
     'CONVERTION_MATRIX'
 ]
 
 import decimal
 import inspect
 from datetime import datetime, date
-from functools import partial
-from typing import Dict, Type, Optional, NamedTuple
+from functools import partial, lru_cache
+from typing import Dict, Type, Optional, NamedTuple, Callable
 
 import bson
 from mongoengine import fields
 
+from mongoengine_migrate.utils import get_closest_parent
 from . import converters
 
 
@@ -148,6 +151,10 @@ class TypeKeyRegistryItem(NamedTuple):
 #: there is used handler associated with this field or CommonFieldHander
 type_key_registry: Dict[str, TypeKeyRegistryItem] = {}
 
+#: Type keys found by `get_parent_type_key` for field classes which
+#: are not in type_key registry. Cleared on every registry change
+_parent_type_keys: Dict[Type[fields.BaseField], Optional[str]] = {}
+
 
 def add_type_key(field_cls: Type[fields.BaseField]):
     """
@@ -160,6 +167,7 @@ def add_type_key(field_cls: Type[fields.BaseField]):
 
     type_key_registry[field_cls.__name__] = TypeKeyRegistryItem(field_cls=field_cls,
                                                                 field_handler_cls=None)
+    _parent_type_keys.clear()
 
 
 def add_field_handler(field_cls: Type[fields.BaseField], handler_cls: Type['CommonFieldHandler']):
@@ -183,6 +191,25 @@ def add_field_handler(field_cls: Type[fields.BaseField], handler_cls: Type['Comm
                 field_cls=registry_item.field_cls,
                 field_handler_cls=handler_cls
             )
+    _parent_type_keys.clear()
+
+
+def get_parent_type_key(field_cls: Type[fields.BaseField]) -> Optional[str]:
+    """
+    Return type key of the closest parent of a given mongoengine field
+    class, which is in type_key registry. Used for field classes which
+    are not in registry, e.g. user defined fields.
+
+    Results are cached, so the registry is scanned once for a class
+    :param field_cls: mongoengine field class
+    :return: type key or None if not found
+    """
+    if field_cls not in _parent_type_keys:
+        parent_cls = get_closest_parent(field_cls,
+                                        (x.field_cls for x in type_key_registry.values()))
+        _parent_type_keys[field_cls] = parent_cls.__name__ if parent_cls is not None else None
+
+    return _parent_type_keys[field_cls]
 
 
 # Fill out the type key registry with all mongoengine fields
@@ -304,6 +331,9 @@ def get_geojson_converters(from_type):
 #:
 #: Format: {field_type1: {field_type2: converter_function, ...}, ...}
 #:
+#: Lookups are cached by `get_type_converter`, so call
+#: `get_type_converter.cache_clear()` after changing this matrix
+#:
 CONVERTION_MATRIX = {
     fields.ObjectIdField: OBJECTID_CONVERTERS.copy(),
     fields.StringField: {
@@ -477,3 +507,30 @@ for klass, converters_mapping in CONVERTION_MATRIX.items():
 
     # Force set convertion between class and its parent/child class
     CONVERTION_MATRIX[klass][klass] = converters.nothing
+
+
+@lru_cache(maxsize=None)
+def get_type_converter(from_field_cls: Type[fields.BaseField],
+                       to_field_cls: Type[fields.BaseField]) -> Optional[Callable]:
+    """
+    Return converter from convertion matrix for a given pair of
+    mongoengine field classes. Classes are searched either as exact
+    class equality or the nearest parent.
+
+    Results are cached, including misses. If CONVERTION_MATRIX is
+    changed after the first lookup (e.g. converters for a custom field
+    were added), call `get_type_converter.cache_clear()`
+    :param from_field_cls: mongoengine field class which was used
+     before
+    :param to_field_cls: mongoengine field class which will be used
+     further
+    :return: converter function or None if not found
+    """
+    type_converters = CONVERTION_MATRIX.get(from_field_cls) or \
+        CONVERTION_MATRIX.get(get_closest_parent(from_field_cls, CONVERTION_MATRIX.keys()))
+
+    if type_converters is None:
+        return None
+
+    return type_converters.get(to_field_cls) or \
+        type_converters.get(get_closest_parent(to_field_cls, type_converters))
@@ -35,3 +35,9 @@ DOCUMENT_NAME_SEPARATOR = '->'
 #: Pay attention: max BSON size is 16Mb
 #: https://docs.mongodb.com/manual/reference/limits/#bson-documents
 BULK_BUFFER_LENGTH = 10000
+
+
+#: Collections which estimated documents count is more than this value
+#: are updated in batches of bulk writes instead of single update_many
+#: query, see `mongo.bulk_update_many`
+BULK_UPDATE_THRESHOLD = 100000
@@ -24,11 +24,11 @@ from pymongo import MongoClient
 import mongoengine_migrate.flags as runtime_flags
 from mongoengine_migrate.actions.factory import build_actions_chain
 from mongoengine_migrate.exceptions import MongoengineMigrateError, ActionError, MigrationGraphError
-from mongoengine_migrate.fields.registry import type_key_registry
+from mongoengine_migrate.fields.registry import type_key_registry, get_parent_type_key
 from mongoengine_migrate.graph import Migration, MigrationsGraph, MigrationPolicy
 from mongoengine_migrate.query_tracer import DatabaseQueryTracer
 from mongoengine_migrate.schema import Schema
-from mongoengine_migrate.utils import get_closest_parent, get_document_type
+from mongoengine_migrate.utils import get_document_type
 
 log = logging.getLogger('mongoengine-migrate')
 
@@ -87,13 +87,16 @@ def collect_models_schema() -> Schema:
     schema = Schema()
     collections: Dict[str, set] = {}  # {collection_name: set(top_level_documents)}
 
+    # {field_cls: TypeKeyRegistryItem}
+    field_mapping_registry = {x.field_cls: x for x in type_key_registry.values()}
+
     # Retrieve models from mongoengine global document registry
     for model_cls in _document_registry.values():
-        log.debug('> Reading document %s', repr(model_cls))
+        log.debug('> Reading document %r', model_cls)
         # NOTE: EmbeddedDocuments are not append 'abstract' in meta if
         # `meta` is defined
         if model_cls._meta.get('abstract'):
-            log.debug('> Skip %s since it is an abstract document')
+            log.debug('> Skip %r since it is an abstract document', model_cls)
             continue
 
         document_type = get_document_type(model_cls)
@@ -124,9 +127,6 @@ def collect_models_schema() -> Schema:
         if model_cls._dynamic:
             schema[document_type].parameters['dynamic'] = True
 
-        # {field_cls: TypeKeyRegistryItem}
-        field_mapping_registry = {x.field_cls: x for x in type_key_registry.values()}
-
         # Collect schema for every field
         for field_name, field_obj in model_cls._fields.items():
             # Exclude '_id' special MongoDB field since it is immutable
@@ -136,23 +136,19 @@ def collect_models_schema() -> Schema:
 
             field_cls = field_obj.__class__
 
-            if field_cls in field_mapping_registry:
-                registry_field_cls = field_cls
-            else:
-                registry_field_cls = get_closest_parent(
-                    field_cls,
-                    field_mapping_registry.keys()
-                )
-
-            if registry_field_cls is None:
-                raise ActionError(f'Could not find {field_cls!r} or one of its base classes '
-                                  f'in type_key registry')
+            registry_item = field_mapping_registry.get(field_cls)
+            if registry_item is None:
+                parent_type_key = get_parent_type_key(field_cls)
+                if parent_type_key is None:
+                    raise ActionError(f'Could not find {field_cls!r} or one of its base classes '
+                                      f'in type_key registry')
+                registry_item = type_key_registry[parent_type_key]
 
-            handler_cls = field_mapping_registry[registry_field_cls].field_handler_cls
+            handler_cls = registry_item.field_handler_cls
             schema[document_type][field_name] = handler_cls.build_schema(field_obj)
             # TODO: validate default against all field restrictions such as min_length, regex, etc.
 
-        log.debug("> Schema '%s' => %s", document_type, str(schema[document_type]))
+        log.debug("> Schema '%s' => %s", document_type, schema[document_type])
 
     return schema
 
@@ -344,7 +340,7 @@ class MongoengineMigrate:
         for migration in graph.walk_down(graph.initial, unapplied_only=True):
             log.info('Upgrading %s...', migration.name)
             for idx, action_object in enumerate(migration.get_actions(), start=1):
-                log.debug('> [%d] %s', idx, str(action_object))
+                log.debug('> [%d] %s', idx, action_object)
                 if not action_object.dummy_action and not runtime_flags.schema_only:
                     action_object.prepare(db, left_schema, migration.policy)
                     action_object.run_forward()
@@ -418,7 +414,7 @@ class MongoengineMigrate:
                 range(1, len(migration.get_actions()) + 1)
             )
             for action_object, action_diff, idx in reversed(list(action_diffs)):
-                log.debug('> [%d] %s', idx, str(action_object))
+                log.debug('> [%d] %s', idx, action_object)
 
                 try:
                     left_schema = patch(list(swap(action_diff)), left_schema)
@@ -1,11 +1,14 @@
 __all__ = [
     'check_empty_result',
-    'mongo_version'
+    'mongo_version',
+    'bulk_update_many'
 ]
 
 import functools
 import logging
+from typing import Optional, List
 
+from pymongo import UpdateOne
 from pymongo.collection import Collection
 
 from mongoengine_migrate.exceptions import InconsistencyError
@@ -25,17 +28,69 @@ def check_empty_result(collection: Collection, db_field: str, find_filter: dict)
     :param find_filter: collection.find() method filter argument
     :raises MigrationError: if any records found
     """
-    bad_records = list(collection.find(find_filter, limit=3))
+    # Only '_id' and the field are needed for error message
+    projection = {db_field: True} if db_field else None
+    bad_records = list(collection.find(find_filter, projection, limit=3))
     if bad_records:
+        # Count is calculated on server side and only when error
+        # is going to be raised
+        bad_count = collection.count_documents(find_filter)
         examples = (
             f'{{_id: {x.get("_id", "unknown")},...{db_field}: {x.get(db_field, "unknown")}}}'
             for x in bad_records
         )
-        raise InconsistencyError(f"Field {collection.name}.{db_field} in some records "
+        raise InconsistencyError(f"Field {collection.name}.{db_field} in {bad_count} records "
                                  f"has wrong values. First several examples: "
                                  f"{','.join(examples)}")
 
 
+def bulk_update_many(collection: Collection,
+                     find_filter: dict,
+                     update: dict,
+                     array_filters: Optional[List[dict]] = None) -> None:
+    """
+    Perform the same update as `collection.update_many` does. If
+    collection has more than `BULK_UPDATE_THRESHOLD` documents then
+    update is performed in batches: only `_id` of matched records are
+    fetched, then update operations are sent by bulk writes of
+    `BULK_BUFFER_LENGTH` items. This avoids a single long-running query
+    on large collections. Smaller collections are updated by a single
+    update_many query
+    :param collection: pymongo collection object to update in
+    :param find_filter: collection.find() method filter argument
+    :param update: update document
+    :param array_filters: array filters for update operations
+    :return:
+    """
+    if collection.estimated_document_count() <= flags.BULK_UPDATE_THRESHOLD:
+        collection.update_many(find_filter, update, array_filters=array_filters)
+        return
+
+    if flags.dry_run:
+        msg = '* db.%s.find(%s, {_id: 1}) -> [Loop] -> db.%s.bulk_write([UpdateOne(%s)...])'
+        log.info(msg, collection.name, find_filter, collection.name, update)
+        return
+
+    bulk_db = flags.database2
+    bulk_collection = bulk_db[collection.name]
+
+    buf = []
+    cursor = collection.find(find_filter, {'_id': 1}).batch_size(flags.BULK_BUFFER_LENGTH)
+    for doc in cursor:
+        # Repeat filter in order to not touch records which
+        # was changed after they was fetched
+        buf.append(UpdateOne({**find_filter, '_id': doc['_id']}, update,
+                             array_filters=array_filters))
+
+        # Flush buffer
+        if len(buf) >= flags.BULK_BUFFER_LENGTH:
+            bulk_collection.bulk_write(buf, ordered=False)
+            buf.clear()
+    if buf:
+        bulk_collection.bulk_write(buf, ordered=False)
+        buf.clear()
+
+
 def mongo_version(min_version: str = None, max_version: str = None):
     """
     Decorator restrict decorated change method execution by
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 import pytest
 
 from mongoengine_migrate.actions import AlterDocument
@@ -17,8 +15,9 @@ class TestAlterDocument:
 
         action = AlterDocument('Schema1Doc1', collection='new_name1')
         action.prepare(test_db, schema, MigrationPolicy.strict)
-        expect = deepcopy(dump)
-        expect['new_name1'] = expect.pop('schema1_doc1')
+        # Shallow copy is enough since documents are not modified
+        expect = {**dump, 'new_name1': dump['schema1_doc1']}
+        del expect['schema1_doc1']
 
         action.run_forward()
 
@@ -8,6 +8,7 @@ import pytest
 import bson
 from bson import ObjectId
 
+import mongoengine_migrate.flags as flags
 from mongoengine_migrate.actions import AlterField
 from mongoengine_migrate.exceptions import SchemaError, MigrationError, InconsistencyError
 from mongoengine_migrate.graph import MigrationPolicy
@@ -52,9 +53,15 @@ class TestAlterFieldCommonDbField:
         ('~Schema1EmbDoc1', 'embdoc1_str'),
         ('~Schema1EmbDoc2', 'embdoc2_str')
     ))
+    @pytest.mark.parametrize('bulk_update_threshold', (
+        flags.BULK_UPDATE_THRESHOLD,
+        -1  # Force batched update
+    ))
     def test_forward_backward__should_rename_field_back(
-            self, load_fixture, test_db, dump_db, document_type, field_name
+            self, load_fixture, test_db, dump_db, monkeypatch, document_type, field_name,
+            bulk_update_threshold
     ):
+        monkeypatch.setattr(flags, 'BULK_UPDATE_THRESHOLD', bulk_update_threshold)
         schema = load_fixture('schema1').get_schema()
 
         dump = dump_db()
@@ -69,6 +76,28 @@ class TestAlterFieldCommonDbField:
 
         assert dump_db() == dump
 
+    @pytest.mark.parametrize('document_type,field_name', (
+        ('Schema1Doc1', 'doc1_str'),
+        ('~Schema1EmbDoc1', 'embdoc1_str'),
+        ('~Schema1EmbDoc2', 'embdoc2_str')
+    ))
+    def test_forward_backward__if_db_field_is_not_changed__should_do_nothing(
+            self, load_fixture, test_db, dump_db, document_type, field_name
+    ):
+        schema = load_fixture('schema1').get_schema()
+
+        dump = dump_db()
+
+        action = AlterField(document_type, field_name, db_field=field_name)
+        action.prepare(test_db, schema, MigrationPolicy.strict)
+        action.run_forward()
+        action.cleanup()
+        action.prepare(test_db, schema, MigrationPolicy.strict)
+
+        action.run_backward()
+
+        assert dump_db() == dump
+
 
 class TestAlterFieldCommonRequired:
     def test_forward__for_document_when_default_is_set__should_set_to_default_value(
@@ -90,6 +119,34 @@ class TestAlterFieldCommonRequired:
 
         assert dump_db() == expect
 
+    @pytest.mark.parametrize('document_type,field_name', (
+        ('Schema1Doc1', 'doc1_str_empty'),
+        ('~Schema1EmbDoc1', 'embdoc1_str_empty'),
+        ('~Schema1EmbDoc2', 'embdoc2_str_empty')
+    ))
+    def test_forward__for_large_collection_when_default_is_set__should_set_to_default_value(
+            self, load_fixture, test_db, dump_db, monkeypatch, document_type, field_name
+    ):
+        monkeypatch.setattr(flags, 'BULK_UPDATE_THRESHOLD', -1)  # Force batched update
+        default = 'test!'
+        schema = load_fixture('schema1').get_schema()
+
+        dump = dump_db()
+        expect = deepcopy(dump)
+        if document_type.startswith('~'):
+            parsers = load_fixture('schema1').get_embedded_jsonpath_parsers(document_type)
+        else:
+            parsers = (jsonpath_rw.parse('schema1_doc1[*]'), )
+        for rec in itertools.chain.from_iterable(p.find(expect) for p in parsers):
+            rec.value[field_name] = default
+
+        action = AlterField(document_type, field_name, required=True, default=default)
+        action.prepare(test_db, schema, MigrationPolicy.strict)
+
+        action.run_forward()
+
+        assert dump_db() == expect
+
     def test_forward__for_embedded_document__should_make_required(
             self, load_fixture, test_db, dump_db
     ):
@@ -287,6 +344,7 @@ class TestAlterFieldCommonChoices:
         (None, [str(x) for x in range(11)]),  # set up
         (['doesnt', 'match'], [str(x) for x in range(11)]),  # change
         ([], [str(x) for x in range(11)]),  # change
+        (None, {str(x) for x in range(11)}),  # set up with a set
     ))
     def test_forward__on_setup_or_change_choices_and_if_field_values_are_in_choices__do_nothing(
             self, load_fixture, test_db, dump_db, document_type, field_name, old_choices, new_choices,
@@ -310,7 +368,8 @@ class TestAlterFieldCommonChoices:
     ))
     @pytest.mark.parametrize('old_choices,new_choices', (
         (None, ['choices', 'which', 'doesnt', 'match']),  # set up
-        ([str(x) for x in range(11)], ['choices', 'which', 'doesnt', 'match'])  # change
+        ([str(x) for x in range(11)], ['choices', 'which', 'doesnt', 'match']),  # change
+        (None, {'choices', 'which', 'doesnt', 'match'}),  # set up with a set
     ))
     def test_forward__on_setup_or_change_choices_and_if_some_values_are_not_in_choices__raise_error(
             self, load_fixture, test_db, document_type, field_name, old_choices, new_choices
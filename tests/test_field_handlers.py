@@ -0,0 +1,19 @@
+import pytest
+
+from mongoengine_migrate.exceptions import SchemaError
+from mongoengine_migrate.fields import StringFieldHandler
+from mongoengine_migrate.graph import MigrationPolicy
+
+
+def test_change_param__if_parameter_is_unknown__should_raise_error(test_db, load_fixture):
+    schema = load_fixture('schema1').get_schema()
+    field_schema = schema['Schema1Doc1']['doc1_str']
+    handler = StringFieldHandler(test_db,
+                                 'Schema1Doc1',
+                                 schema,
+                                 field_schema,
+                                 field_schema,
+                                 MigrationPolicy.strict)
+
+    with pytest.raises(SchemaError):
+        handler.change_param('doc1_str', 'nonexistent')